@@ -1,22 +1,39 @@
 import os
+import sys
 import json
+import logging
+import logging.handlers
+import traceback
+import gzip
 import time
+import shutil
+import tempfile
 from datetime import datetime, timedelta
 import threading
+import queue
+import random
+import argparse
+from concurrent.futures import Future
 from plyer import notification
 import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
-from collections import Counter
+from collections import Counter, OrderedDict, defaultdict
 import sqlite3
 
 class TaskPlanner:
-    def __init__(self, master):
+    def __init__(self, master, watchdog=False):
         self.master = master
         self.master.title("Task Planner")
         self.master.geometry("600x400")
+
+        # Installed before any widget exists so every command callback is timed
+        self.watchdog = MainLoopWatchdog(master) if watchdog else None
+        if self.watchdog:
+            self.watchdog.start()
         
         self.db = TaskDatabase()
+        self.graph = TaskGraph(self.db)
         
         # Load theme preference
         self.theme = self.load_theme()
@@ -49,6 +66,9 @@ class TaskPlanner:
         self.apply_theme()    
             
         self.start_notification_checker()
+
+        self.backups = TaskBackup(self.db)
+        self.backups.start()
         
     # Theme Colors
     themes = {
@@ -88,7 +108,10 @@ class TaskPlanner:
     
     def show_category_chart(self):
         style = self.chart_styles[self.theme]
-        categories, counts = zip(*Counter(task[3] for task in self.db.get_tasks()).items())
+        category_counts = self.db.count_by("category")
+        if not category_counts:
+            return
+        categories, counts = zip(*category_counts)
         plt.figure(figsize=(6, 4))
         plt.bar(categories, counts, color=style["bar"])
         plt.title("Tasks by Category", color=style["text"])
@@ -104,7 +127,10 @@ class TaskPlanner:
 
     def show_priority_chart(self):
         style = self.chart_styles[self.theme]
-        priorities, counts = zip(*Counter(task[4] for task in self.db.get_tasks()).items())
+        priority_counts = self.db.count_by("priority")
+        if not priority_counts:
+            return
+        priorities, counts = zip(*priority_counts)
         plt.figure(figsize=(6, 4))
         plt.pie(
             counts,
@@ -193,11 +219,11 @@ class TaskPlanner:
         deadline_entry.pack(pady=5)
 
         tk.Label(add_window, text="Category", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-        category_combo = ttk.Combobox(add_window, values=["Work", "Personal", "Learning", "Health", "Other"])
+        category_combo = ttk.Combobox(add_window, values=self.db.get_categories())
         category_combo.pack(pady=5)
 
         tk.Label(add_window, text="Priority", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-        priority_combo = ttk.Combobox(add_window, values=["High", "Medium", "Low"])
+        priority_combo = ttk.Combobox(add_window, values=self.db.get_priorities())
         priority_combo.pack(pady=5)
 
         def save_task():
@@ -256,8 +282,11 @@ class TaskPlanner:
             task_name = task_name_entry.get()
             for task in self.db.get_tasks():
                 if task[1].lower() == task_name.lower() and task[5] == "pending":
-                    self.db.update_task(task[0], "status", "completed")
+                    unblocked = self.graph.complete(task[0])
                     tk.Label(complete_window, text=f"Task '{task_name}' marked as completed!", fg="green", bg=theme["bg"]).pack(pady=5)
+                    if unblocked:
+                        names = ", ".join(task[1] for task in self.db.get_tasks() if task[0] in unblocked)
+                        tk.Label(complete_window, text=f"Now ready: {names}", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
                     return
             tk.Label(complete_window, text=f"Task '{task_name}' not found or already completed.", fg="red", bg=theme["bg"]).pack(pady=5)
 
@@ -274,11 +303,11 @@ class TaskPlanner:
         filter_window.configure(bg=theme["bg"])
 
         tk.Label(filter_window, text="Filter by Priority", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-        priority_combo = ttk.Combobox(filter_window, values=["High", "Medium", "Low"])
+        priority_combo = ttk.Combobox(filter_window, values=self.db.get_priorities())
         priority_combo.pack(pady=5)
 
         tk.Label(filter_window, text="Filter by Category", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-        category_combo = ttk.Combobox(filter_window, values=["Work", "Personal", "Learning", "Health", "Other"])
+        category_combo = ttk.Combobox(filter_window, values=self.db.get_categories())
         category_combo.pack(pady=5)
 
         tk.Label(filter_window, text="Filter by Due Date", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
@@ -289,13 +318,25 @@ class TaskPlanner:
         task_list.pack(pady=10)
 
         def apply_filters():
-            tasks = self.db.get_tasks()
-            filtered_tasks = tasks
             priority = priority_combo.get()
             category = category_combo.get()
             due_date = due_date_combo.get()
 
-            # Filter logic...
+            # Priority and category are matched on their integer codes in SQL
+            filtered_tasks = self.db.get_tasks(category=category or None, priority=priority or None)
+            if due_date:
+                now = datetime.now()
+                week_start = (now - timedelta(days=now.weekday())).date()
+                due_checks = {
+                    "Today": lambda day: day == now.date(),
+                    "This Week": lambda day: week_start <= day <= week_start + timedelta(days=6),
+                    "This Month": lambda day: (day.year, day.month) == (now.year, now.month),
+                }
+                if due_date in due_checks:
+                    filtered_tasks = [
+                        task for task in filtered_tasks
+                        if due_checks[due_date](datetime.strptime(task[2], "%Y-%m-%d %H:%M:%S").date())
+                    ]
 
             task_list.delete(0, tk.END)
             if not filtered_tasks:
@@ -321,12 +362,10 @@ class TaskPlanner:
         theme = self.themes[self.theme]
         stats_window.configure(bg=theme["bg"])
 
-        tasks = self.db.get_tasks()
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for task in tasks if task[5] == "completed")
-        pending_tasks = sum(1 for task in tasks if task[5] == "pending")
-        category_counts = Counter(task[3] for task in tasks)
-        priority_counts = Counter(task[4] for task in tasks)
+        status_counts = dict(self.db.count_by("status"))
+        total_tasks = sum(status_counts.values())
+        completed_tasks = status_counts.get("completed", 0)
+        pending_tasks = status_counts.get("pending", 0)
 
         tk.Label(stats_window, text=f"Total Tasks: {total_tasks}", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
         tk.Label(stats_window, text=f"Completed Tasks: {completed_tasks}", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
@@ -379,20 +418,20 @@ class TaskPlanner:
                 deadline_entry.pack(pady=5)
 
                 tk.Label(form_window, text="Category", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-                category_combo = ttk.Combobox(form_window, values=["Work", "Personal", "Learning", "Health", "Other"])
+                category_combo = ttk.Combobox(form_window, values=self.db.get_categories())
                 category_combo.set(selected_task[3])
                 category_combo.pack(pady=5)
 
                 tk.Label(form_window, text="Priority", bg=theme["bg"], fg=theme["fg"]).pack(pady=5)
-                priority_combo = ttk.Combobox(form_window, values=["High", "Medium", "Low"])
+                priority_combo = ttk.Combobox(form_window, values=self.db.get_priorities())
                 priority_combo.set(selected_task[4])
                 priority_combo.pack(pady=5)
 
                 def save_edits():
                     updated_name = name_entry.get()
                     updated_deadline = deadline_entry.get()
-                    updated_category = category_combo.get()
-                    updated_priority = priority_combo.get()
+                    updated_category = category_combo.get() or "General"
+                    updated_priority = priority_combo.get() or "Medium"
 
                     self.db.update_task(selected_task[0], "name", updated_name)
                     self.db.update_task(selected_task[0], "deadline", updated_deadline)
@@ -411,20 +450,8 @@ class TaskPlanner:
     def start_notification_checker(self):
         def check_deadlines():
             while True:
-                now = datetime.now()
-                tasks = self.db.get_tasks()
-                for task in tasks:
-                    task_id, name, deadline, category, priority, status, created_at = task
-                    if status == "pending":
-                        try:
-                            deadline_dt = datetime.strptime(deadline, "%Y-%m-%d %H:%M:%S")
-                            time_left = (deadline_dt - now).total_seconds()
-                            if time_left < 0:
-                                self.show_notification(f"Task Overdue: {name}", f"Deadline was {deadline}")
-                            elif 0 <= time_left <= 300:  # Due within 5 minutes
-                                self.show_notification(f"Task Due Soon: {name}", f"Deadline: {deadline}")
-                        except ValueError:
-                            print(f"Invalid deadline format for task '{name}': {deadline}")
+                for title, message in deadline_alerts(self.db.get_tasks(), datetime.now()):
+                    self.show_notification(title, message)
                 time.sleep(60)
 
         notification_thread = threading.Thread(target=check_deadlines, daemon=True)
@@ -711,18 +738,355 @@ class TaskPlanner:
                 )
 
 class TaskDatabase:
-    def __init__(self, db_file="tasks.db"):
+    # Seconds a statement waits for a lock; long enough to sit out a deferred index build
+    busy_timeout = 30.0
+
+    def __init__(self, db_file="tasks.db", group_commit=False, cache_bytes=8 * 1024 * 1024):
         self.db_file = db_file
-        self.connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.connection = sqlite3.connect(self.db_file, timeout=self.busy_timeout, check_same_thread=False)
         self.cursor = self.connection.cursor()
+        # The shared connection is used from both the Tk and notifier threads
+        self.write_lock = threading.Lock()
+        self.write_lock_wait = 0.0
         self.create_table()
+        self.writer = GroupCommitWriter(self.db_file, timeout=self.busy_timeout) if group_commit else None
+        self.cache = QueryCache(self.db_file, cache_bytes, timeout=self.busy_timeout) if cache_bytes else None
         
     def get_connection(self):
         """Creates a new SQLite connection for the current thread."""
-        return sqlite3.connect(self.db_file)
+        return sqlite3.connect(self.db_file, timeout=self.busy_timeout)
 
     def create_table(self):
-        self.cursor.execute("""
+        """Applies pending schema migrations; data backfills continue in the background."""
+        self.migrator = SchemaMigrator(self.db_file)
+        self.migrator.migrate()
+        self.migrator.start()
+        self.codes = {field: {} for field in self.lookup_tables}
+
+    # Dictionary-encoded task columns and the lookup table holding their values
+    lookup_tables = {"category": "categories", "priority": "priorities", "status": "statuses"}
+
+    def code_for(self, field, value, create=False, conn=None):
+        """Returns the integer code for a category, priority or status name.
+
+        Names match case-insensitively. Unknown names return None, or are
+        added to the lookup table when `create` is set; blank names are
+        never added and raise ValueError. Pass `conn` to add them inside
+        that connection's open transaction.
+        """
+        if create and not value.strip():
+            raise ValueError(f"A {field} name cannot be blank.")
+        key = value.lower()
+        code = self.codes[field].get(key)
+        if code is not None:
+            return code
+
+        table = self.lookup_tables[field]
+        select = f"SELECT id FROM {table} WHERE name = ?"
+        if conn is not None:
+            row = conn.execute(select, (value,)).fetchone()
+            if row is None and create:
+                conn.execute(self.insert_lookup_sql(table), (value,))
+                row = conn.execute(select, (value,)).fetchone()
+            return row[0] if row else None
+
+        with self.write_lock:
+            row = self.cursor.execute(select, (value,)).fetchone()
+            if row is None and create:
+                self.cursor.execute(self.insert_lookup_sql(table), (value,))
+                self.connection.commit()
+                row = self.cursor.execute(select, (value,)).fetchone()
+        if row is None:
+            return None
+        self.codes[field][key] = row[0]
+        return row[0]
+
+    def insert_lookup_sql(self, table):
+        if table == "priorities":
+            return "INSERT OR IGNORE INTO priorities (name, rank) VALUES (?, (SELECT COALESCE(MAX(rank), 0) + 1 FROM priorities))"
+        return f"INSERT OR IGNORE INTO {table} (name) VALUES (?)"
+
+    def execute_write(self, sql, params=()):
+        """Runs a mutation, through the group-commit writer when it is enabled.
+
+        Returns a Future that resolves once the change is committed, or None
+        when the write was committed synchronously on the shared connection.
+        """
+        if self.cache:
+            self.cache.invalidate()
+        if self.writer:
+            return self.writer.submit(sql, params)
+        started = time.perf_counter()
+        with self.write_lock:
+            self.write_lock_wait += time.perf_counter() - started
+            self.cursor.execute(sql, params)
+            self.connection.commit()
+
+    def add_task(self, name, deadline, category, priority):
+        return self.execute_write("""
+        INSERT INTO tasks (name, deadline, category, priority, status, category_id, priority_id, status_id, created_at)
+        VALUES (?, ?, NULL, NULL, NULL, ?, ?, ?, ?)
+        """, (
+            name,
+            deadline,
+            self.code_for("category", category, create=True),
+            self.code_for("priority", priority, create=True),
+            self.code_for("status", "pending"),
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        ))
+
+    def query(self, sql, params=()):
+        """Runs a read query, served from the query cache when it is enabled."""
+        if self.cache:
+            return self.cache.query(sql, params)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def get_tasks(self, category=None, priority=None, status=None):
+        """Fetches tasks, optionally filtered on category, priority and status names.
+
+        Rows the encoding backfill has not reached yet are matched on their text value.
+        """
+        conditions = []
+        params = []
+        for field, value in (("category", category), ("priority", priority), ("status", status)):
+            if value:
+                conditions.append(f"({field}_id = ? OR ({field}_id IS NULL AND {field} = ? COLLATE NOCASE))")
+                params += [self.code_for(field, value), value]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.query(
+            f"SELECT id, name, deadline, category, priority, status, created_at FROM task_view{where}", params
+        )
+
+    def count_by(self, field):
+        """Returns (name, count) pairs for category, priority or status, in lookup order.
+
+        Rows the encoding backfill has not reached yet are counted by their
+        text value and merged in case-insensitively.
+        """
+        table = self.lookup_tables[field]
+        order = "l.rank" if table == "priorities" else "l.id"
+        # One statement, so a backfill batch committing mid-count cannot drop rows from both halves
+        rows = self.query(f"""
+        SELECT l.name, counts.total, 0 AS part, {order} AS position FROM (
+            SELECT {field}_id AS code, COUNT(*) AS total FROM tasks
+            WHERE {field}_id IS NOT NULL GROUP BY {field}_id
+        ) counts
+        JOIN {table} l ON l.id = counts.code
+        UNION ALL
+        SELECT {field}, COUNT(*), 1, 0 FROM tasks
+        WHERE {field}_id IS NULL AND {field} IS NOT NULL
+        GROUP BY {field} COLLATE NOCASE
+        ORDER BY part, position
+        """)
+        totals = {}
+        for name, total, _, _ in rows:
+            totals.setdefault(name.lower(), [name, 0])[1] += total
+        return [tuple(entry) for entry in totals.values()]
+
+    def get_categories(self):
+        return [row[0] for row in self.query("SELECT name FROM categories ORDER BY id")]
+
+    def get_priorities(self):
+        return [row[0] for row in self.query("SELECT name FROM priorities ORDER BY rank")]
+
+    def add_category(self, name):
+        return self.code_for("category", name, create=True)
+
+    def update_task(self, task_id, field, value):
+        if field in self.lookup_tables:
+            return self.execute_write(
+                f"UPDATE tasks SET {field}_id = ?, {field} = NULL WHERE id = ?",
+                (self.code_for(field, value, create=True), task_id),
+            )
+        return self.execute_write(f"UPDATE tasks SET {field} = ? WHERE id = ?", (value, task_id))
+
+    def delete_task(self, task_id):
+        return self.execute_write("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def add_dependency(self, task_id, depends_on):
+        return self.execute_write(
+            "INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) VALUES (?, ?)", (task_id, depends_on)
+        )
+
+    def remove_dependency(self, task_id, depends_on):
+        return self.execute_write(
+            "DELETE FROM task_dependencies WHERE task_id = ? AND depends_on = ?", (task_id, depends_on)
+        )
+
+    def get_dependencies(self):
+        return self.query("SELECT task_id, depends_on FROM task_dependencies")
+
+    @property
+    def lock_wait(self):
+        """Seconds writes spent waiting: on the shared-connection lock, or queued for the writer thread."""
+        return self.write_lock_wait + (self.writer.queue_wait if self.writer else 0.0)
+
+    def flush(self):
+        """Blocks until every queued write has been committed."""
+        if self.writer:
+            self.writer.flush().result()
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+        if self.cache:
+            self.cache.close()
+        self.connection.close()
+
+class SchemaMigrator:
+    """Brings a task database up to the current schema version.
+
+    Migrations are numbered by `PRAGMA user_version`. Each one is short DDL
+    applied in a single transaction together with the version bump, so a
+    crash leaves the file at either the old or the new version. Rewrites of
+    existing rows are registered as backfills and run afterwards on a
+    background thread in bounded id ranges, one transaction per batch, with
+    the position saved alongside each batch so an interrupted backfill
+    resumes where it stopped. Indexes on `tasks` are built on the same
+    thread, each one queued right after the backfill whose column it
+    covers, so opening a large store does not wait on them.
+    """
+    def __init__(self, db_file, batch_size=2000, pause=0.01):
+        self.db_file = db_file
+        self.batch_size = batch_size
+        self.pause = pause
+        self.migrations = [
+            self.create_tasks_table,
+            self.create_sync_tracking,
+            self.create_dependency_table,
+            self.create_lookup_tables,
+            self.add_peer_node_ids,
+            self.track_dependency_changes,
+        ]
+        self.thread = None
+
+    def connect(self):
+        # Transactions are managed explicitly so DDL and data changes commit together
+        return sqlite3.connect(self.db_file, isolation_level=None)
+
+    def migrate(self):
+        """Applies every migration newer than the file's user_version."""
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_backfills (
+                name TEXT PRIMARY KEY,
+                position INTEGER NOT NULL DEFAULT 0,
+                done INTEGER NOT NULL DEFAULT 0
+            )
+            """)
+            for version, migration in enumerate(self.migrations, start=1):
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    # Re-read under the write lock in case another process migrated first
+                    if cursor.execute("PRAGMA user_version").fetchone()[0] >= version:
+                        cursor.execute("ROLLBACK")
+                        continue
+                    migration(cursor)
+                    cursor.execute(f"PRAGMA user_version = {version}")
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+        finally:
+            conn.close()
+
+    def start(self):
+        """Runs outstanding backfills on a background thread."""
+        if self.pending_backfills():
+            self.thread = threading.Thread(target=self.run_backfills, daemon=True)
+            self.thread.start()
+
+    def wait(self):
+        """Blocks until the background backfills have finished."""
+        if self.thread:
+            self.thread.join()
+
+    def pending_backfills(self):
+        conn = self.connect()
+        try:
+            return [row[0] for row in conn.execute("SELECT name FROM schema_backfills WHERE done = 0 ORDER BY rowid")]
+        finally:
+            conn.close()
+
+    def run_backfills(self):
+        conn = self.connect()
+        try:
+            for name in self.pending_backfills():
+                if name.startswith("index:"):
+                    self.build_index(conn, name)
+                    continue
+                while self.run_batch(conn, name):
+                    time.sleep(self.pause)
+        except sqlite3.Error as error:
+            print(f"Schema backfill stopped, it will resume on next start: {error}")
+        finally:
+            conn.close()
+
+    def build_index(self, conn, name):
+        """Builds a deferred index in one transaction.
+
+        Writers are locked out while it runs, roughly two seconds per
+        million tasks, so TaskDatabase connections use a busy timeout that
+        outlasts a build instead of failing with "database is locked".
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(self.indexes[name[len("index:"):]])
+            cursor.execute("UPDATE schema_backfills SET done = 1 WHERE name = ?", (name,))
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def run_batch(self, conn, name):
+        """Backfills the next id range for `name`; returns False once it is done."""
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            start = cursor.execute("SELECT position FROM schema_backfills WHERE name = ?", (name,)).fetchone()[0]
+            end = cursor.execute(
+                "SELECT MAX(id) FROM (SELECT id FROM tasks WHERE id > ? ORDER BY id LIMIT ?)",
+                (start, self.batch_size),
+            ).fetchone()[0]
+            if end is None:
+                cursor.execute("UPDATE schema_backfills SET done = 1 WHERE name = ?", (name,))
+            else:
+                for statement in self.backfills[name]:
+                    cursor.execute(statement, {"start": start, "end": end})
+                cursor.execute("UPDATE schema_backfills SET position = ? WHERE name = ?", (end, name))
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        return end is not None
+
+    def execute_script(self, cursor, script):
+        # executescript() would commit the migration's transaction, so run statements one by one
+        statement = ""
+        for part in script.split(";"):
+            statement += part + ";"
+            if sqlite3.complete_statement(statement):
+                if statement.strip(" \n;"):
+                    cursor.execute(statement)
+                statement = ""
+
+    def add_columns(self, cursor, columns):
+        existing = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
+        for column, definition in columns.items():
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} {definition}")
+
+    def register_backfill(self, cursor, name):
+        cursor.execute("INSERT OR IGNORE INTO schema_backfills (name) VALUES (?)", (name,))
+
+    def create_tasks_table(self, cursor):
+        cursor.execute("""
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -733,33 +1097,1222 @@ class TaskDatabase:
             created_at TEXT NOT NULL
         )
         """)
-        self.connection.commit()
 
-    def add_task(self, name, deadline, category, priority):
-        self.cursor.execute("""
-        INSERT INTO tasks (name, deadline, category, priority, created_at)
-        VALUES (?, ?, ?, ?, ?)
-        """, (name, deadline, category, priority, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        self.connection.commit()
-
-    def get_tasks(self):
-        """Fetches all tasks using a thread-safe connection."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks")
-            return cursor.fetchall()
+    def create_sync_tracking(self, cursor):
+        """Adds per-row versions and change triggers used by SyncEngine.
+
+        Every insert, update and delete bumps a local change sequence, so
+        changes since any watermark can be found without scanning the table.
+        """
+        self.add_columns(cursor, {
+            "uid": "TEXT",
+            "version": "INTEGER DEFAULT 0",
+            "modified_at": "TEXT",
+            "origin": "TEXT",
+            "change_seq": "INTEGER DEFAULT 0",
+        })
+        self.execute_script(cursor, """
+        CREATE TABLE IF NOT EXISTS sync_meta (
+            key TEXT PRIMARY KEY,
+            value
+        );
+        INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('node_id', lower(hex(randomblob(8))));
+        INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('change_seq', 0);
+        INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('tracking', 1);
+
+        CREATE TABLE IF NOT EXISTS task_tombstones (
+            uid TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            modified_at TEXT NOT NULL,
+            origin TEXT NOT NULL,
+            change_seq INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS sync_peers (
+            peer TEXT PRIMARY KEY,
+            exported_seq INTEGER DEFAULT 0,
+            imported_seq INTEGER DEFAULT 0
+        );
+
+        CREATE INDEX IF NOT EXISTS task_tombstones_change_seq ON task_tombstones (change_seq);
+
+        CREATE TRIGGER IF NOT EXISTS tasks_track_insert AFTER INSERT ON tasks
+        WHEN NEW.uid IS NULL
+        BEGIN
+            UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq';
+            UPDATE tasks SET
+                uid = lower(hex(randomblob(16))),
+                version = 1,
+                modified_at = strftime('%Y-%m-%d %H:%M:%f', 'now'),
+                origin = (SELECT value FROM sync_meta WHERE key = 'node_id'),
+                change_seq = (SELECT value FROM sync_meta WHERE key = 'change_seq')
+            WHERE id = NEW.id;
+        END;
+
+        -- Storage-only rewrites (such as backfills) switch tracking off
+        -- inside their own transaction so they do not bump row versions.
+        DROP TRIGGER IF EXISTS tasks_track_update;
+        CREATE TRIGGER tasks_track_update AFTER UPDATE ON tasks
+        WHEN NEW.change_seq IS OLD.change_seq
+            AND (SELECT value FROM sync_meta WHERE key = 'tracking') = 1
+        BEGIN
+            UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq';
+            UPDATE tasks SET
+                version = OLD.version + 1,
+                modified_at = strftime('%Y-%m-%d %H:%M:%f', 'now'),
+                origin = (SELECT value FROM sync_meta WHERE key = 'node_id'),
+                change_seq = (SELECT value FROM sync_meta WHERE key = 'change_seq')
+            WHERE id = NEW.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS tasks_track_delete AFTER DELETE ON tasks
+        WHEN OLD.uid IS NOT NULL
+        BEGIN
+            UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq';
+            INSERT OR REPLACE INTO task_tombstones (uid, version, modified_at, origin, change_seq)
+            VALUES (
+                OLD.uid,
+                OLD.version + 1,
+                strftime('%Y-%m-%d %H:%M:%f', 'now'),
+                (SELECT value FROM sync_meta WHERE key = 'node_id'),
+                (SELECT value FROM sync_meta WHERE key = 'change_seq')
+            );
+        END;
+        """)
+        # Rows created before change tracking existed get an identity of their own
+        self.register_backfill(cursor, "assign_uids")
+        self.register_backfill(cursor, "index:tasks_uid")
+        self.register_backfill(cursor, "index:tasks_change_seq")
+
+    def create_dependency_table(self, cursor):
+        """Creates the edge table behind TaskGraph: `task_id` waits on `depends_on`."""
+        self.execute_script(cursor, """
+        CREATE TABLE IF NOT EXISTS task_dependencies (
+            task_id INTEGER NOT NULL,
+            depends_on INTEGER NOT NULL,
+            PRIMARY KEY (task_id, depends_on)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS task_dependencies_depends_on ON task_dependencies (depends_on);
+
+        CREATE TRIGGER IF NOT EXISTS tasks_drop_dependencies AFTER DELETE ON tasks
+        BEGIN
+            DELETE FROM task_dependencies WHERE task_id = OLD.id OR depends_on = OLD.id;
+        END;
+        """)
 
-    def update_task(self, task_id, field, value):
-        self.cursor.execute(f"UPDATE tasks SET {field} = ? WHERE id = ?", (value, task_id))
-        self.connection.commit()
+    def create_lookup_tables(self, cursor):
+        """Moves category, priority and status into lookup tables with integer codes.
+
+        The original text columns stay in the schema for old rows but are
+        cleared once a row is encoded; `task_view` joins the names back in
+        and falls back to the text for rows the backfill has not reached yet.
+        """
+        self.execute_script(cursor, """
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
+        );
+        CREATE TABLE IF NOT EXISTS priorities (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+            rank INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS statuses (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
+        );
+
+        INSERT OR IGNORE INTO categories (id, name) VALUES
+            (1, 'Work'), (2, 'Personal'), (3, 'Learning'), (4, 'Health'), (5, 'Other'), (6, 'General');
+        INSERT OR IGNORE INTO priorities (id, name, rank) VALUES (1, 'High', 1), (2, 'Medium', 2), (3, 'Low', 3);
+        INSERT OR IGNORE INTO statuses (id, name) VALUES (1, 'pending'), (2, 'completed');
+        """)
 
-    def delete_task(self, task_id):
-        self.cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.connection.commit()
+        columns = {f"{field}_id": f"INTEGER REFERENCES {table} (id)" for field, table in TaskDatabase.lookup_tables.items()}
+        self.add_columns(cursor, columns)
+
+        cursor.execute("""
+        CREATE VIEW IF NOT EXISTS task_view AS
+        SELECT
+            t.id, t.name, t.deadline,
+            COALESCE(c.name, t.category) AS category,
+            COALESCE(p.name, t.priority) AS priority,
+            COALESCE(s.name, t.status) AS status,
+            t.created_at, t.category_id, t.priority_id, t.status_id,
+            t.uid, t.version, t.modified_at, t.origin, t.change_seq
+        FROM tasks t
+        LEFT JOIN categories c ON c.id = t.category_id
+        LEFT JOIN priorities p ON p.id = t.priority_id
+        LEFT JOIN statuses s ON s.id = t.status_id
+        """)
+        self.register_backfill(cursor, "encode_lookups")
+        for column in columns:
+            self.register_backfill(cursor, f"index:tasks_{column}")
+
+    def add_peer_node_ids(self, cursor):
+        """Remembers each sync peer's node id so rows it authored are not sent back to it."""
+        existing = {row[1] for row in cursor.execute("PRAGMA table_info(sync_peers)")}
+        if "node_id" not in existing:
+            cursor.execute("ALTER TABLE sync_peers ADD COLUMN node_id TEXT")
+
+    def track_dependency_changes(self, cursor):
+        """Logs every dependency insert and delete under the task change sequence.
+
+        TaskGraph replays the log to pick up edges other connections changed
+        without rereading the whole table.
+        """
+        self.execute_script(cursor, """
+        CREATE TABLE IF NOT EXISTS dependency_changes (
+            change_seq INTEGER PRIMARY KEY,
+            task_id INTEGER NOT NULL,
+            depends_on INTEGER NOT NULL,
+            added INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS task_dependencies_track_insert AFTER INSERT ON task_dependencies
+        BEGIN
+            UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq';
+            INSERT INTO dependency_changes (change_seq, task_id, depends_on, added)
+            VALUES ((SELECT value FROM sync_meta WHERE key = 'change_seq'), NEW.task_id, NEW.depends_on, 1);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_dependencies_track_delete AFTER DELETE ON task_dependencies
+        BEGIN
+            UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq';
+            INSERT INTO dependency_changes (change_seq, task_id, depends_on, added)
+            VALUES ((SELECT value FROM sync_meta WHERE key = 'change_seq'), OLD.task_id, OLD.depends_on, 0);
+        END;
+        """)
+
+    # Index builds on `tasks` scan the whole table, so they run in the background instead of at startup
+    indexes = {
+        "tasks_uid": "CREATE UNIQUE INDEX IF NOT EXISTS tasks_uid ON tasks (uid)",
+        "tasks_change_seq": "CREATE INDEX IF NOT EXISTS tasks_change_seq ON tasks (change_seq)",
+        "tasks_category_id": "CREATE INDEX IF NOT EXISTS tasks_category_id ON tasks (category_id)",
+        "tasks_priority_id": "CREATE INDEX IF NOT EXISTS tasks_priority_id ON tasks (priority_id)",
+        "tasks_status_id": "CREATE INDEX IF NOT EXISTS tasks_status_id ON tasks (status_id)",
+    }
+
+    # Batch statements for each backfill, run for task ids in (:start, :end]
+    backfills = {
+        "assign_uids": [
+            "UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq'",
+            """
+            UPDATE tasks SET
+                uid = lower(hex(randomblob(16))),
+                version = 1,
+                modified_at = strftime('%Y-%m-%d %H:%M:%f', 'now'),
+                origin = (SELECT value FROM sync_meta WHERE key = 'node_id'),
+                change_seq = (SELECT value FROM sync_meta WHERE key = 'change_seq')
+            WHERE id > :start AND id <= :end AND uid IS NULL
+            """,
+        ],
+        "encode_lookups": [
+            "UPDATE sync_meta SET value = 0 WHERE key = 'tracking'",
+            """
+            INSERT OR IGNORE INTO categories (name)
+            SELECT DISTINCT category FROM tasks WHERE id > :start AND id <= :end AND category IS NOT NULL
+            """,
+            """
+            INSERT OR IGNORE INTO priorities (name, rank)
+            SELECT DISTINCT priority, 99 FROM tasks WHERE id > :start AND id <= :end AND priority IS NOT NULL
+            """,
+            """
+            INSERT OR IGNORE INTO statuses (name)
+            SELECT DISTINCT status FROM tasks WHERE id > :start AND id <= :end AND status IS NOT NULL
+            """,
+            """
+            UPDATE tasks SET
+                category_id = COALESCE(category_id, (SELECT id FROM categories WHERE name = tasks.category)),
+                priority_id = COALESCE(priority_id, (SELECT id FROM priorities WHERE name = tasks.priority)),
+                status_id = COALESCE(status_id, (SELECT id FROM statuses WHERE name = tasks.status)),
+                category = NULL,
+                priority = NULL,
+                status = NULL
+            WHERE id > :start AND id <= :end
+                AND (category IS NOT NULL OR priority IS NOT NULL OR status IS NOT NULL)
+            """,
+            "UPDATE sync_meta SET value = 1 WHERE key = 'tracking'",
+        ],
+    }
+
+class QueryCache:
+    """LRU cache of read-query results, keyed by normalized SQL and parameters.
+
+    Before each lookup the cache compares `PRAGMA data_version` on its own
+    connection; the value changes whenever any other connection commits, so
+    entries are dropped as soon as the database changes underneath them.
+    Misses run outside the lock on a connection owned by the calling thread,
+    and their result is only kept if `data_version` has not moved while the
+    query ran.
+    """
+    def __init__(self, db_file, max_bytes, timeout=5.0):
+        self.db_file = db_file
+        self.timeout = timeout
+        self.connection = sqlite3.connect(db_file, timeout=timeout, check_same_thread=False)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.size = 0
+        self.data_version = None
+        self.hits = 0
+        self.misses = 0
+        self.readers = threading.local()
+
+    def query(self, sql, params=()):
+        # Include types so 1, True and 1.0 do not share an entry
+        key = (" ".join(sql.split()), tuple((type(param), param) for param in params))
+        with self.lock:
+            data_version = self.check_version()
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[0])
+            self.misses += 1
+
+        rows = self.reader().execute(sql, params).fetchall()
+
+        with self.lock:
+            # A commit between the version check and the read means the rows
+            # may be newer than data_version says; return them but don't cache
+            if self.check_version() == data_version:
+                self.store(key, rows)
+        return list(rows)
+
+    def reader(self):
+        # Opening a connection per miss costs more than most of the queries
+        connection = getattr(self.readers, "connection", None)
+        if connection is None:
+            connection = self.readers.connection = sqlite3.connect(self.db_file, timeout=self.timeout)
+        return connection
+
+    def check_version(self):
+        """Clears the cache if another connection has committed; returns the current version."""
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self.data_version:
+            self.clear()
+            self.data_version = data_version
+        return data_version
+
+    def store(self, key, rows):
+        size = self.estimate_size(rows)
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (rows, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def estimate_size(self, rows):
+        size = sys.getsizeof(rows)
+        for row in rows:
+            size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+        return size
+
+    def invalidate(self):
+        """Drops every cached result; called on local writes."""
+        with self.lock:
+            self.clear()
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
 
     def close(self):
+        # Readers opened by other threads are closed when those threads exit
+        connection = getattr(self.readers, "connection", None)
+        if connection is not None:
+            connection.close()
         self.connection.close()
 
+class GroupCommitWriter:
+    """Applies queued mutations on a single thread, committing them in groups.
+
+    Whatever has queued up while the previous group was committing goes into
+    the next group, up to `max_batch` writes, so a burst of mutations costs
+    one fsync instead of one per statement. A group is committed as soon as
+    the queue is empty; set `linger` to wait that many seconds for more
+    writes first, trading latency for larger groups.
+    """
+    def __init__(self, db_file, max_batch=500, linger=0.0, timeout=5.0):
+        self.db_file = db_file
+        self.timeout = timeout
+        self.max_batch = max_batch
+        self.linger = linger
+        self.queue_wait = 0.0
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, sql, params=()):
+        """Queues a statement and returns a Future for its commit."""
+        future = Future()
+        self.queue.put((sql, params, future, time.perf_counter()))
+        return future
+
+    def flush(self):
+        """Returns a Future that resolves after all earlier writes are committed."""
+        return self.submit(None)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self):
+        connection = sqlite3.connect(self.db_file, timeout=self.timeout)
+        running = True
+        while running:
+            item = self.queue.get()
+            if item is None:
+                break
+            batch = [item]
+            linger_until = time.monotonic() + self.linger
+            while len(batch) < self.max_batch:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    remaining = linger_until - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            # Time from submit until the group starts is how long each write waited its turn
+            started = time.perf_counter()
+            self.queue_wait += sum(started - submitted for _, _, _, submitted in batch)
+            try:
+                self.commit_batch(connection, batch)
+            except Exception as error:
+                # Keep the writer alive: fail this group and carry on with the next one
+                if connection.in_transaction:
+                    connection.rollback()
+                for _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+        connection.close()
+
+    def commit_batch(self, connection, batch):
+        results = []
+        cursor = connection.cursor()
+        for sql, params, future, _ in batch:
+            if sql is None:
+                results.append((future, None, None))
+                continue
+            try:
+                cursor.execute(sql, params)
+                results.append((future, cursor.lastrowid, None))
+            except Exception as error:
+                results.append((future, None, error))
+        try:
+            connection.commit()
+        except Exception as error:
+            connection.rollback()
+            for future, _, _ in results:
+                future.set_exception(error)
+            return
+        for future, result, error in results:
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+class BackupRestarted(Exception):
+    """Raised when concurrent commits keep restarting a paced backup."""
+
+class TaskBackup:
+    """Online backups of the task database using the SQLite backup API.
+
+    Pages are copied in small batches with a pause between them, so the GUI
+    and notifier threads keep access to the database while a backup runs.
+    SQLite restarts a backup whenever another connection commits; after
+    `max_restarts` restarts the copy falls back to a single step so a busy
+    database still gets backed up.
+    """
+    def __init__(self, db, backup_dir="backups", interval=3600, retention=24, pages=64, sleep=0.01,
+                 max_restarts=3):
+        self.db = db
+        self.backup_dir = backup_dir
+        self.interval = interval
+        self.retention = retention
+        self.pages = pages
+        self.sleep = sleep
+        self.max_restarts = max_restarts
+
+    def start(self):
+        """Starts the scheduled backup thread."""
+        def scheduled_backups():
+            # Schema backfills commit constantly, which would only restart the first backup
+            self.db.migrator.wait()
+            while True:
+                try:
+                    self.run_backup()
+                except (sqlite3.Error, OSError) as error:
+                    print(f"Backup failed: {error}")
+                time.sleep(self.interval)
+
+        backup_thread = threading.Thread(target=scheduled_backups, daemon=True)
+        backup_thread.start()
+
+    def run_backup(self):
+        """Writes a new timestamped backup and prunes old ones."""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.backup_dir, f"tasks-{stamp}.db")
+        self.copy_to(path, self.pages, self.sleep)
+        self.prune()
+        return path
+
+    def export_snapshot(self, path):
+        """Exports a point-in-time copy of the database to `path`.
+
+        The copy is made in a single step, so it reflects exactly one
+        committed state even if other connections write concurrently.
+        """
+        self.copy_to(path, -1)
+        return path
+
+    def copy_to(self, path, pages, pause=0):
+        # Copy into a temporary file first so a crash never leaves a torn backup behind.
+        temp_path = path + ".part"
+        self.remove_partial(temp_path)
+        try:
+            self.backup_into(temp_path, pages, self.paced_progress(pause) if pages > 0 else None)
+        except BackupRestarted:
+            # Writes land faster than a paced pass completes; copy in one step instead
+            self.backup_into(temp_path, -1, None)
+        os.replace(temp_path, path)
+
+    def backup_into(self, temp_path, pages, progress):
+        source = self.db.get_connection()
+        target = sqlite3.connect(temp_path)
+        try:
+            try:
+                source.backup(target, pages=pages, progress=progress)
+            finally:
+                target.close()
+                source.close()
+        except BaseException:
+            self.remove_partial(temp_path)
+            raise
+
+    def paced_progress(self, pause):
+        """Progress callback that pauses between batches and gives up after repeated restarts.
+
+        Connection.backup only sleeps after a busy step, so the pacing happens
+        here. A restart shows up as the remaining page count going back up.
+        """
+        state = {"remaining": None, "restarts": 0}
+
+        def progress(status, remaining, total):
+            if state["remaining"] is not None and remaining > state["remaining"]:
+                state["restarts"] += 1
+                if state["restarts"] > self.max_restarts:
+                    raise BackupRestarted()
+            state["remaining"] = remaining
+            if pause:
+                time.sleep(pause)
+
+        return progress
+
+    def remove_partial(self, temp_path):
+        for leftover in (temp_path, temp_path + "-journal"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+    def list_backups(self):
+        """Returns backup file paths, oldest first."""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        names = sorted(name for name in os.listdir(self.backup_dir)
+                       if name.startswith("tasks-") and name.endswith(".db"))
+        return [os.path.join(self.backup_dir, name) for name in names]
+
+    def prune(self):
+        """Deletes backups beyond the retention count and files left by interrupted runs."""
+        backups = self.list_backups()
+        for path in backups[:max(len(backups) - self.retention, 0)]:
+            os.remove(path)
+        for name in os.listdir(self.backup_dir):
+            if name.startswith("tasks-") and name.endswith((".db.part", ".db.part-journal")):
+                os.remove(os.path.join(self.backup_dir, name))
+
+class SyncEngine:
+    """Exchanges task changes with other planner instances through change-set files.
+
+    A change-set holds only the rows and deletions recorded since the last
+    export to a given peer. Applying one is idempotent: each row carries a
+    (version, modified_at, origin) clock and the most recent modification
+    wins, with the version and then the origin node breaking ties.
+    """
+    fields = ("name", "deadline", "category", "priority", "status", "created_at")
+    format_version = 1
+
+    def __init__(self, db):
+        self.db = db
+
+    def node_id(self, conn):
+        return conn.execute("SELECT value FROM sync_meta WHERE key = 'node_id'").fetchone()[0]
+
+    def next_change_seq(self, conn):
+        conn.execute("UPDATE sync_meta SET value = value + 1 WHERE key = 'change_seq'")
+        return conn.execute("SELECT value FROM sync_meta WHERE key = 'change_seq'").fetchone()[0]
+
+    def export_changes(self, peer, path, since=None):
+        """Writes changes not yet sent to `peer` into a gzip-compressed JSON file.
+
+        Returns the number of rows and deletions written.
+        """
+        conn = self.db.get_connection()
+        try:
+            row = conn.execute("SELECT exported_seq, node_id FROM sync_peers WHERE peer = ?", (peer,)).fetchone()
+            if since is None:
+                since = row[0] if row else 0
+            # Changes the peer authored itself (including ones we imported from it) are already there
+            peer_node = row[1] if row and row[1] else ""
+            until = conn.execute("SELECT value FROM sync_meta WHERE key = 'change_seq'").fetchone()[0]
+            columns = ", ".join(("uid", "version", "modified_at", "origin") + self.fields)
+            rows = conn.execute(f"""
+            SELECT {columns} FROM task_view
+            WHERE change_seq > ? AND change_seq <= ? AND uid IS NOT NULL AND origin IS NOT ?
+            ORDER BY change_seq
+            """, (since, until, peer_node)).fetchall()
+            deleted = conn.execute("""
+            SELECT uid, version, modified_at, origin FROM task_tombstones
+            WHERE change_seq > ? AND change_seq <= ? AND origin IS NOT ?
+            ORDER BY change_seq
+            """, (since, until, peer_node)).fetchall()
+
+            change_set = {
+                "format": self.format_version,
+                "origin": self.node_id(conn),
+                "since": since,
+                "until": until,
+                "fields": list(self.fields),
+                "rows": rows,
+                "deleted": deleted,
+            }
+            temp_path = path + ".part"
+            with gzip.open(temp_path, "wt", encoding="utf-8") as change_file:
+                json.dump(change_set, change_file, separators=(",", ":"))
+            os.replace(temp_path, path)
+
+            conn.execute("""
+            INSERT INTO sync_peers (peer, exported_seq) VALUES (?, ?)
+            ON CONFLICT (peer) DO UPDATE SET exported_seq = excluded.exported_seq
+            """, (peer, until))
+            conn.commit()
+            return len(rows) + len(deleted)
+        finally:
+            conn.close()
+
+    def apply_changes(self, path, peer=None):
+        """Applies a change-set file, keeping whichever side has the newer clock.
+
+        `peer` is the name this side exports to the sender under; it defaults
+        to the sender's node id. Returns counts of applied rows, applied
+        deletions and skipped entries.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as change_file:
+            change_set = json.load(change_file)
+        if change_set.get("format") != self.format_version:
+            raise ValueError(f"Unsupported change-set format: {change_set.get('format')}")
+
+        fields = change_set["fields"]
+        stats = {"applied": 0, "deleted": 0, "skipped": 0}
+        conn = self.db.get_connection()
+        try:
+            # Take the write lock up front so no local edit lands between a clock check and its write
+            conn.execute("BEGIN IMMEDIATE")
+            for row in change_set["rows"]:
+                uid, clock, values = row[0], tuple(row[1:4]), row[4:]
+                local = conn.execute(
+                    "SELECT id, version, modified_at, origin FROM tasks WHERE uid = ?", (uid,)
+                ).fetchone()
+                if not self.is_newer(conn, uid, clock, local):
+                    stats["skipped"] += 1
+                    continue
+                seq = self.next_change_seq(conn)
+                columns, values = self.encode(conn, fields, values)
+                if local:
+                    assignments = ", ".join(f"{column} = ?" for column in columns)
+                    conn.execute(
+                        f"UPDATE tasks SET {assignments}, version = ?, modified_at = ?, origin = ?, change_seq = ? WHERE id = ?",
+                        (*values, *clock, seq, local[0]),
+                    )
+                else:
+                    column_list = ", ".join(("uid", *columns, "version", "modified_at", "origin", "change_seq"))
+                    placeholders = ", ".join("?" * (len(columns) + 5))
+                    conn.execute(
+                        f"INSERT INTO tasks ({column_list}) VALUES ({placeholders})",
+                        (uid, *values, *clock, seq),
+                    )
+                conn.execute("DELETE FROM task_tombstones WHERE uid = ?", (uid,))
+                stats["applied"] += 1
+
+            for uid, *clock in change_set["deleted"]:
+                clock = tuple(clock)
+                local = conn.execute(
+                    "SELECT id, version, modified_at, origin FROM tasks WHERE uid = ?", (uid,)
+                ).fetchone()
+                if not self.is_newer(conn, uid, clock, local):
+                    stats["skipped"] += 1
+                    continue
+                if local:
+                    conn.execute("DELETE FROM tasks WHERE id = ?", (local[0],))
+                seq = self.next_change_seq(conn)
+                conn.execute("""
+                INSERT OR REPLACE INTO task_tombstones (uid, version, modified_at, origin, change_seq)
+                VALUES (?, ?, ?, ?, ?)
+                """, (uid, *clock, seq))
+                stats["deleted"] += 1
+
+            conn.execute("""
+            INSERT INTO sync_peers (peer, imported_seq, node_id) VALUES (?, ?, ?)
+            ON CONFLICT (peer) DO UPDATE SET
+                imported_seq = max(imported_seq, excluded.imported_seq),
+                node_id = excluded.node_id
+            """, (peer or change_set["origin"], change_set["until"], change_set["origin"]))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return stats
+
+    def encode(self, conn, fields, values):
+        """Maps incoming category, priority and status names to local integer codes."""
+        columns = []
+        encoded = []
+        for field, value in zip(fields, values):
+            if field in self.db.lookup_tables:
+                columns += [field, f"{field}_id"]
+                encoded += [None, self.db.code_for(field, value, create=True, conn=conn) if value and value.strip() else None]
+            else:
+                columns.append(field)
+                encoded.append(value)
+        return columns, encoded
+
+    def is_newer(self, conn, uid, clock, local):
+        """Checks an incoming clock against the local row or its tombstone."""
+        current = tuple(local[1:]) if local else None
+        if current is None:
+            current = conn.execute(
+                "SELECT version, modified_at, origin FROM task_tombstones WHERE uid = ?", (uid,)
+            ).fetchone()
+        if current is None:
+            return True
+        # Last writer wins: order by modified_at (UTC) before version and origin
+        version, modified_at, origin = clock
+        current_version, current_modified_at, current_origin = current
+        return (modified_at, version, origin) > (current_modified_at, current_version, current_origin)
+
+class TaskGraph:
+    """In-memory dependency graph that keeps the set of ready tasks up to date.
+
+    Each pending task tracks how many of its prerequisites are still pending,
+    so completing a task only touches its direct dependents instead of
+    re-sorting the whole graph.
+
+    Every task and dependency write bumps the database's change sequence, so
+    before answering the graph applies whatever changed since it last looked:
+    task rows and tombstones newer than its watermark, and the dependency
+    change log. Replaying those changes is idempotent, so the graph's own
+    dependency writes are applied right away and simply seen again later.
+    """
+    def __init__(self, db):
+        self.db = db
+        self.load()
+
+    def change_seq(self):
+        return self.db.query("SELECT value FROM sync_meta WHERE key = 'change_seq'")[0][0]
+
+    def refresh(self):
+        """Applies changes made since the last refresh; returns the tasks that became ready."""
+        change_seq = self.change_seq()
+        if change_seq == self.seen_seq:
+            return []
+        since = self.seen_seq
+        # Rows are read after the sequence, so anything newer is simply applied again next time
+        self.seen_seq = change_seq
+
+        unblocked = []
+        for task_id, uid, deadline, status in self.db.query(
+            "SELECT id, uid, deadline, status FROM task_view WHERE change_seq > ?", (since,)
+        ):
+            if uid is not None:
+                self.ids[uid] = task_id
+            self.deadlines[task_id] = deadline
+            unblocked += self.set_pending(task_id, status == "pending")
+        for (uid,) in self.db.query("SELECT uid FROM task_tombstones WHERE change_seq > ?", (since,)):
+            task_id = self.ids.pop(uid, None)
+            if task_id is not None:
+                unblocked += self.drop_task(task_id)
+        for task_id, depends_on, added in self.db.query(
+            "SELECT task_id, depends_on, added FROM dependency_changes WHERE change_seq > ? ORDER BY change_seq",
+            (since,),
+        ):
+            if added:
+                self.link(task_id, depends_on)
+            elif self.unlink(task_id, depends_on):
+                unblocked.append(task_id)
+        return [task_id for task_id in unblocked if task_id in self.ready]
+
+    def load(self):
+        """Rebuilds the graph from the database."""
+        # Read the sequence first so a write racing with the load is applied by the next refresh
+        self.seen_seq = self.change_seq()
+        self.deadlines = {}
+        self.ids = {}
+        self.pending = set()
+        for task_id, uid, deadline, status in self.db.query("SELECT id, uid, deadline, status FROM task_view"):
+            self.deadlines[task_id] = deadline
+            if uid is not None:
+                self.ids[uid] = task_id
+            if status == "pending":
+                self.pending.add(task_id)
+
+        self.prerequisites = defaultdict(set)
+        self.dependents = defaultdict(set)
+        for task_id, depends_on in self.db.get_dependencies():
+            self.prerequisites[task_id].add(depends_on)
+            self.dependents[depends_on].add(task_id)
+
+        self.blockers = {
+            task_id: sum(1 for prerequisite in self.prerequisites[task_id] if prerequisite in self.pending)
+            for task_id in self.pending
+        }
+        self.ready = {task_id for task_id, count in self.blockers.items() if count == 0}
+
+    def set_pending(self, task_id, pending):
+        """Moves a task into or out of the pending set; returns dependents it unblocked."""
+        if pending == (task_id in self.pending):
+            return []
+        if pending:
+            self.pending.add(task_id)
+            self.blockers[task_id] = sum(
+                1 for prerequisite in self.prerequisites[task_id] if prerequisite in self.pending
+            )
+            if self.blockers[task_id] == 0:
+                self.ready.add(task_id)
+            for dependent in self.dependents[task_id]:
+                if dependent in self.pending:
+                    self.blockers[dependent] += 1
+                    self.ready.discard(dependent)
+            return []
+        self.pending.discard(task_id)
+        self.ready.discard(task_id)
+        del self.blockers[task_id]
+        return [dependent for dependent in self.dependents[task_id]
+                if dependent in self.pending and self.unblock(dependent)]
+
+    def drop_task(self, task_id):
+        unblocked = self.set_pending(task_id, False)
+        for depends_on in list(self.prerequisites[task_id]):
+            self.unlink(task_id, depends_on)
+        for dependent in list(self.dependents[task_id]):
+            self.unlink(dependent, task_id)
+        self.deadlines.pop(task_id, None)
+        return unblocked
+
+    def link(self, task_id, depends_on):
+        if depends_on in self.prerequisites[task_id]:
+            return
+        self.prerequisites[task_id].add(depends_on)
+        self.dependents[depends_on].add(task_id)
+        if task_id in self.pending and depends_on in self.pending:
+            self.blockers[task_id] += 1
+            self.ready.discard(task_id)
+
+    def unlink(self, task_id, depends_on):
+        """Removes an edge; returns True if that left `task_id` ready."""
+        if depends_on not in self.prerequisites[task_id]:
+            return False
+        self.prerequisites[task_id].discard(depends_on)
+        self.dependents[depends_on].discard(task_id)
+        return task_id in self.pending and depends_on in self.pending and self.unblock(task_id)
+
+    def add_dependency(self, task_id, depends_on):
+        """Makes `task_id` wait on `depends_on`; raises ValueError if that would create a cycle."""
+        self.refresh()
+        for known in (task_id, depends_on):
+            if known not in self.deadlines:
+                raise ValueError(f"Task {known} does not exist.")
+        if depends_on in self.prerequisites[task_id]:
+            return
+        if task_id == depends_on or self.reaches(depends_on, task_id):
+            raise ValueError(f"Task {task_id} depending on task {depends_on} would create a cycle.")
+        self.db.add_dependency(task_id, depends_on)
+        self.link(task_id, depends_on)
+
+    def remove_dependency(self, task_id, depends_on):
+        self.refresh()
+        if depends_on not in self.prerequisites[task_id]:
+            return
+        self.db.remove_dependency(task_id, depends_on)
+        self.unlink(task_id, depends_on)
+
+    def reaches(self, start, target):
+        """Checks whether `start` depends on `target`, directly or transitively."""
+        stack = [start]
+        seen = {start}
+        while stack:
+            for prerequisite in self.prerequisites[stack.pop()]:
+                if prerequisite == target:
+                    return True
+                if prerequisite not in seen:
+                    seen.add(prerequisite)
+                    stack.append(prerequisite)
+        return False
+
+    def complete(self, task_id):
+        """Marks a task completed and returns the tasks it unblocked."""
+        self.refresh()
+        if task_id not in self.pending:
+            return []
+        future = self.db.update_task(task_id, "status", "completed")
+        if future is not None:
+            future.result()
+        return [dependent for dependent in self.refresh() if dependent in self.dependents[task_id]]
+
+    def unblock(self, task_id):
+        self.blockers[task_id] -= 1
+        if self.blockers[task_id] == 0:
+            self.ready.add(task_id)
+            return True
+        return False
+
+    def ready_tasks(self):
+        """Pending tasks with no pending prerequisites, earliest deadline first."""
+        self.refresh()
+        return sorted(self.ready, key=lambda task_id: self.deadlines[task_id])
+
+    def blocked_tasks(self):
+        """Pending tasks still waiting on at least one prerequisite."""
+        self.refresh()
+        return sorted(self.pending - self.ready, key=lambda task_id: self.deadlines[task_id])
+
+    def critical_path(self):
+        """Returns the chain of pending tasks with the least slack, first prerequisite first.
+
+        Tasks have deadlines but no durations, so a chain's slack is the time
+        left until the deadline of its last task divided by the number of
+        tasks that must be finished by then. An overdue chain's slack is the
+        overdue time multiplied by its length, so the longest late chain
+        comes first. For a given last task the longest chain always has the
+        least slack, so only the longest chain into each task is tracked.
+        """
+        self.refresh()
+        depth = {}
+        previous = {}
+        remaining = dict(self.blockers)
+        frontier = [task_id for task_id in self.pending if remaining[task_id] == 0]
+        while frontier:
+            task_id = frontier.pop()
+            depth.setdefault(task_id, 1)
+            for dependent in self.dependents[task_id]:
+                if dependent not in self.pending:
+                    continue
+                if depth[task_id] + 1 > depth.get(dependent, 0):
+                    depth[dependent] = depth[task_id] + 1
+                    previous[dependent] = task_id
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    frontier.append(dependent)
+
+        if not depth:
+            return []
+        now = datetime.now()
+
+        def slack(task_id):
+            try:
+                left = (datetime.strptime(self.deadlines[task_id], "%Y-%m-%d %H:%M:%S") - now).total_seconds()
+            except (TypeError, ValueError):
+                # Unparseable deadlines never make a chain critical
+                return float("inf")
+            return left / depth[task_id] if left > 0 else left * depth[task_id]
+
+        task_id = min(depth, key=slack)
+        path = [task_id]
+        while task_id in previous:
+            task_id = previous[task_id]
+            path.append(task_id)
+        return path[::-1]
+
+class MainLoopWatchdog:
+    """Opt-in monitor for stalls on the Tk main loop.
+
+    An after() heartbeat measures how late the event loop runs, every Tk
+    callback is timed, and a monitor thread logs a stack sample of the main
+    thread whenever the heartbeat is overdue by more than `stall_threshold`.
+    """
+    def __init__(self, master, log_file="watchdog.log", interval=0.1, stall_threshold=0.5,
+                 slow_callback=0.1, summary_interval=60):
+        self.master = master
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.slow_callback = slow_callback
+        self.summary_interval = summary_interval
+        self.main_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.lock = threading.Lock()
+        self.callback_stats = {}
+
+        self.logger = logging.getLogger("task_planner.watchdog")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=3)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+            self.logger.addHandler(handler)
+
+    def start(self):
+        self.install_callback_timer()
+        self.master.after(int(self.interval * 1000), self.heartbeat)
+        monitor_thread = threading.Thread(target=self.monitor, daemon=True)
+        monitor_thread.start()
+        self.logger.info("Watchdog started")
+
+    def install_callback_timer(self):
+        """Wraps tkinter's callback dispatcher so each callback reports its run time."""
+        watchdog = self
+
+        class TimedCallWrapper(tk.CallWrapper):
+            def __call__(self, *args):
+                started = time.perf_counter()
+                try:
+                    return super().__call__(*args)
+                finally:
+                    watchdog.record_callback(self.func, time.perf_counter() - started)
+
+        tk.CallWrapper = TimedCallWrapper
+
+    def record_callback(self, func, elapsed):
+        name = self.callback_name(func)
+        if name is None:
+            return
+        with self.lock:
+            count, total, longest = self.callback_stats.get(name, (0, 0.0, 0.0))
+            self.callback_stats[name] = (count + 1, total + elapsed, max(longest, elapsed))
+        if elapsed >= self.slow_callback:
+            self.logger.warning(f"Slow callback {name}: {elapsed * 1000:.1f} ms")
+
+    def callback_name(self, func):
+        """Names a Tk callback for the stats; returns None for the watchdog's own heartbeat."""
+        name = getattr(func, "__qualname__", repr(func))
+        if name.endswith(".callit"):
+            # after() wraps every callback in the same closure but copies the original's __name__
+            wrapped = [cell.cell_contents for cell in func.__closure__ or () if callable(cell.cell_contents)]
+            if self.heartbeat in wrapped:
+                return None
+            name = func.__name__
+        return name
+
+    def heartbeat(self):
+        now = time.monotonic()
+        lag = now - self.last_beat - self.interval
+        if lag >= self.slow_callback:
+            self.logger.warning(f"Event loop lag: {lag * 1000:.1f} ms")
+        self.last_beat = now
+        self.master.after(int(self.interval * 1000), self.heartbeat)
+
+    def monitor(self):
+        reported_beat = None
+        next_summary = time.monotonic() + self.summary_interval
+        while True:
+            time.sleep(self.interval / 2)
+            beat = self.last_beat
+            overdue = time.monotonic() - beat - self.interval
+            # One stack sample per stall is enough to see what the main thread is doing
+            if overdue >= self.stall_threshold and beat != reported_beat:
+                reported_beat = beat
+                self.log_stall(overdue)
+            if time.monotonic() >= next_summary:
+                next_summary += self.summary_interval
+                self.log_summary()
+
+    def log_stall(self, overdue):
+        frame = sys._current_frames().get(self.main_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame else "(main thread stack unavailable)\n"
+        self.logger.warning(f"Main loop stalled for {overdue * 1000:.0f} ms, main thread stack:\n{stack.rstrip()}")
+
+    def log_summary(self):
+        with self.lock:
+            stats = sorted(self.callback_stats.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (count, total, longest) in stats[:10]:
+            self.logger.info(
+                f"Callback {name}: {count} calls, {total * 1000:.1f} ms total, "
+                f"{total / count * 1000:.1f} ms avg, {longest * 1000:.1f} ms max"
+            )
+
+class SoakHarness:
+    """Headless stress test of TaskDatabase under concurrent writers and readers.
+
+    Writers and readers share one TaskDatabase, the way the Tk thread and the
+    notifier thread do in the app, while a notifier thread runs the real
+    deadline check in a tight loop. Without `db_file` the run uses a fresh
+    temporary database; an existing file is only replaced if an earlier soak
+    run created it.
+    """
+    def __init__(self, db_file=None, writers=4, readers=4, duration=30, group_commit=False, cache=False):
+        self.db_file = db_file
+        self.writers = writers
+        self.readers = readers
+        self.duration = duration
+        self.group_commit = group_commit
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.latencies = {"write": [], "read": [], "notify": []}
+        self.errors = Counter()
+        self.lock_wait = 0.0
+        self.inserted = 0
+
+    def is_soak_database(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("SELECT value FROM sync_meta WHERE key = 'soak_run'").fetchone() is not None
+        except sqlite3.Error:
+            return False
+        finally:
+            conn.close()
+
+    def record(self, kind, operation):
+        started = time.perf_counter()
+        try:
+            result = operation()
+            if isinstance(result, Future):
+                result.result()
+        except Exception as error:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.errors[f"{type(error).__name__}: {error}"] += 1
+                # A "database is locked" error means the whole busy timeout was spent waiting,
+                # on top of the time TaskDatabase spends waiting for its write lock or writer queue
+                if "locked" in str(error):
+                    self.lock_wait += elapsed
+            return False
+        elapsed = time.perf_counter() - started
+        with self.lock:
+            self.latencies[kind].append(elapsed)
+        return True
+
+    def run(self):
+        temp_dir = None
+        db_file = self.db_file
+        if db_file is None:
+            temp_dir = tempfile.mkdtemp(prefix="task_planner_soak_")
+            db_file = os.path.join(temp_dir, "soak.db")
+        elif os.path.exists(db_file):
+            if not self.is_soak_database(db_file):
+                raise ValueError(f"Refusing to overwrite '{db_file}': it was not created by a soak run.")
+            os.remove(db_file)
+        try:
+            return self.run_on(db_file)
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def run_on(self, db_file):
+        # Reads hit the database unless the query cache is under test
+        cache_bytes = 8 * 1024 * 1024 if self.cache else 0
+        db = TaskDatabase(db_file, group_commit=self.group_commit, cache_bytes=cache_bytes)
+        db.migrator.wait()
+        db.connection.execute("INSERT OR REPLACE INTO sync_meta (key, value) VALUES ('soak_run', 1)")
+        db.connection.commit()
+        stop_at = time.monotonic() + self.duration
+        deadline = (datetime.now() + timedelta(minutes=2)).strftime("%Y-%m-%d %H:%M:%S")
+
+        def writer(seed):
+            rng = random.Random(seed)
+            while time.monotonic() < stop_at:
+                choice = rng.random()
+                # Ids are AUTOINCREMENT, so every inserted task has an id up to the insert count
+                task_id = rng.randint(1, max(self.inserted, 1))
+                if choice < 0.6:
+                    if self.record("write", lambda: db.add_task(f"soak {seed}", deadline, "Work", "High")):
+                        with self.lock:
+                            self.inserted += 1
+                elif choice < 0.9:
+                    self.record("write", lambda: db.update_task(task_id, "status", "completed"))
+                else:
+                    self.record("write", lambda: db.delete_task(task_id))
+
+        def reader():
+            while time.monotonic() < stop_at:
+                self.record("read", db.get_tasks)
+
+        def notifier():
+            while time.monotonic() < stop_at:
+                self.record("notify", lambda: list(deadline_alerts(db.get_tasks(), datetime.now())))
+                time.sleep(0.1)
+
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(self.writers)]
+        threads += [threading.Thread(target=reader) for _ in range(self.readers)]
+        threads.append(threading.Thread(target=notifier))
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        db.flush()
+        elapsed = time.perf_counter() - started
+        self.lock_wait += db.lock_wait
+        db.close()
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        def percentile(samples, fraction):
+            if not samples:
+                return 0.0
+            ordered = sorted(samples)
+            return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] * 1000
+
+        results = {"elapsed": elapsed, "lock_wait": self.lock_wait, "errors": dict(self.errors)}
+        for kind, samples in self.latencies.items():
+            results[kind] = {
+                "count": len(samples),
+                "throughput": len(samples) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(samples, 0.50),
+                "p99_ms": percentile(samples, 0.99),
+            }
+        return results
+
+def print_soak_report(results):
+    print(f"Soak run: {results['elapsed']:.1f}s")
+    for kind in ("write", "read", "notify"):
+        stats = results[kind]
+        print(
+            f"- {kind}: {stats['count']} ops, {stats['throughput']:.1f} ops/s, "
+            f"p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms"
+        )
+    print(f"Lock wait: {results['lock_wait']:.2f}s")
+    print(f"Errors: {sum(results['errors'].values())}")
+    for error, count in results["errors"].items():
+        print(f"- {count}x {error}")
+
+def deadline_alerts(tasks, now):
+    """Yields (title, message) pairs for pending tasks that are overdue or due soon."""
+    for task in tasks:
+        task_id, name, deadline, category, priority, status, created_at = task
+        if status == "pending":
+            try:
+                deadline_dt = datetime.strptime(deadline, "%Y-%m-%d %H:%M:%S")
+                time_left = (deadline_dt - now).total_seconds()
+                if time_left < 0:
+                    yield f"Task Overdue: {name}", f"Deadline was {deadline}"
+                elif 0 <= time_left <= 300:  # Due within 5 minutes
+                    yield f"Task Due Soon: {name}", f"Deadline: {deadline}"
+            except ValueError:
+                print(f"Invalid deadline format for task '{name}': {deadline}")
+
 # Background thread to periodically check deadlines
 def start_deadline_checker(planner):
     def periodic_check():
@@ -770,10 +2323,29 @@ def start_deadline_checker(planner):
     thread = threading.Thread(target=periodic_check, daemon=True)
     thread.start()
 
-# Initialize GUI
-root = tk.Tk()
-app = TaskPlanner(root)
-root.mainloop()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Task Planner")
+    parser.add_argument("--soak", action="store_true", help="run the headless concurrency soak test instead of the GUI")
+    parser.add_argument("--soak-db", help="database file for the soak test (default: a temporary file)")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--group-commit", action="store_true")
+    parser.add_argument("--cache", action="store_true", help="serve soak-test reads through the query cache")
+    parser.add_argument("--watchdog", action="store_true", help="log main-loop stalls and slow callbacks to watchdog.log")
+    args = parser.parse_args()
+
+    if args.soak:
+        harness = SoakHarness(
+            args.soak_db, args.writers, args.readers, args.duration, args.group_commit, args.cache
+        )
+        print_soak_report(harness.run())
+        sys.exit(0)
+
+    # Initialize GUI
+    root = tk.Tk()
+    app = TaskPlanner(root, watchdog=args.watchdog)
+    root.mainloop()
 
 # Example Usage
 # if __name__ == "__main__":
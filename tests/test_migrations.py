@@ -0,0 +1,80 @@
+import sqlite3
+
+from task_planner import SchemaMigrator, TaskDatabase
+
+DEADLINE = "2025-01-05 14:30:00"
+
+
+def create_old_store(path, count):
+    """Writes a tasks.db in the original, pre-migration layout."""
+    conn = sqlite3.connect(path)
+    conn.execute("""
+    CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        deadline TEXT NOT NULL,
+        category TEXT DEFAULT 'General',
+        priority TEXT DEFAULT 'Medium',
+        status TEXT DEFAULT 'pending',
+        created_at TEXT NOT NULL
+    )
+    """)
+    conn.executemany(
+        "INSERT INTO tasks (name, deadline, category, priority, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (f"Task {i}", DEADLINE, ["Work", "work", "Garden"][i % 3], ["High", "low"][i % 2],
+             "completed" if i % 5 == 0 else "pending", DEADLINE)
+            for i in range(count)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_old_store_is_migrated_and_encoded(tmp_path):
+    path = str(tmp_path / "tasks.db")
+    create_old_store(path, 30)
+
+    db = TaskDatabase(path)
+    db.migrator.wait()
+    try:
+        assert db.query("PRAGMA user_version")[0][0] == len(db.migrator.migrations)
+        assert db.query("SELECT COUNT(*) FROM schema_backfills WHERE done = 0")[0][0] == 0
+        assert db.query("""
+        SELECT COUNT(*) FROM tasks
+        WHERE uid IS NULL OR category_id IS NULL OR category IS NOT NULL OR status_id IS NULL
+        """)[0][0] == 0
+
+        assert dict(db.count_by("category")) == {"Work": 20, "Garden": 10}
+        assert dict(db.count_by("status")) == {"pending": 24, "completed": 6}
+        assert len(db.get_tasks(category="WORK", priority="Low")) == 10
+        assert "Garden" in db.get_categories()
+    finally:
+        db.close()
+
+
+def test_interrupted_backfill_resumes(tmp_path):
+    path = str(tmp_path / "tasks.db")
+    create_old_store(path, 25)
+
+    # Stop after the first batch, as if the app had been closed mid-backfill
+    migrator = SchemaMigrator(path, batch_size=10)
+    migrator.migrate()
+    conn = migrator.connect()
+    assert migrator.run_batch(conn, "assign_uids")
+    conn.close()
+    first_batch = sqlite3.connect(path).execute(
+        "SELECT id, uid, change_seq FROM tasks WHERE uid IS NOT NULL ORDER BY id"
+    ).fetchall()
+    assert [row[0] for row in first_batch] == list(range(1, 11))
+
+    db = TaskDatabase(path)
+    db.migrator.wait()
+    try:
+        # Rows from the finished batch keep their identity instead of being redone
+        assert db.query("SELECT id, uid, change_seq FROM tasks WHERE id <= 10 ORDER BY id") == first_batch
+        assert db.query("SELECT COUNT(DISTINCT uid) FROM tasks")[0][0] == 25
+        assert db.query("SELECT COUNT(*) FROM schema_backfills WHERE done = 0")[0][0] == 0
+        assert sum(count for _, count in db.count_by("category")) == 25
+    finally:
+        db.close()
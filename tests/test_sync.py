@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from task_planner import SyncEngine, TaskDatabase
+
+DEADLINE = "2025-01-05 14:30:00"
+
+
+@pytest.fixture
+def planners(tmp_path):
+    databases = []
+
+    def open_planner(name):
+        db = TaskDatabase(str(tmp_path / f"{name}.db"))
+        db.migrator.wait()
+        databases.append(db)
+        return db, SyncEngine(db)
+
+    yield open_planner
+    for db in databases:
+        db.close()
+
+
+def contents(db):
+    return sorted(task[1:] for task in db.get_tasks())
+
+
+def sync(source, target, source_name, target_name, path):
+    """Sends source's changes to target and returns the apply stats."""
+    source.export_changes(target_name, str(path))
+    return target.apply_changes(str(path), peer=source_name)
+
+
+def test_round_trip_and_idempotent_reapply(planners, tmp_path):
+    a, sync_a = planners("a")
+    b, sync_b = planners("b")
+    a.add_task("Write report", DEADLINE, "Work", "High")
+    a.add_task("Go running", DEADLINE, "Health", "Low")
+
+    change_set = tmp_path / "a-to-b.json.gz"
+    assert sync_a.export_changes("b", str(change_set)) == 2
+    assert sync_b.apply_changes(str(change_set), peer="a") == {"applied": 2, "deleted": 0, "skipped": 0}
+    assert contents(b) == contents(a)
+
+    assert sync_b.apply_changes(str(change_set), peer="a") == {"applied": 0, "deleted": 0, "skipped": 2}
+    assert contents(b) == contents(a)
+
+    # Only deltas move: nothing changed, so the next export is empty
+    assert sync_a.export_changes("b", str(tmp_path / "empty.json.gz")) == 0
+
+
+def test_imported_rows_are_not_echoed_back(planners, tmp_path):
+    a, sync_a = planners("a")
+    b, sync_b = planners("b")
+    a.add_task("Write report", DEADLINE, "Work", "High")
+    sync(sync_a, sync_b, "a", "b", tmp_path / "a-to-b.json.gz")
+
+    assert sync_b.export_changes("a", str(tmp_path / "b-to-a.json.gz")) == 0
+
+
+def test_last_writer_wins_on_conflict(planners, tmp_path):
+    a, sync_a = planners("a")
+    b, sync_b = planners("b")
+    a.add_task("Write report", DEADLINE, "Work", "High")
+    sync(sync_a, sync_b, "a", "b", tmp_path / "1.json.gz")
+
+    # a edits twice, b edits once but later: b's edit is the last write
+    a.update_task(1, "name", "Report draft")
+    a.update_task(1, "name", "Report final")
+    time.sleep(0.01)
+    b.update_task(1, "name", "Report from b")
+
+    assert sync(sync_a, sync_b, "a", "b", tmp_path / "2.json.gz")["skipped"] == 1
+    assert sync(sync_b, sync_a, "b", "a", tmp_path / "3.json.gz")["applied"] == 1
+    assert contents(a) == contents(b)
+    assert contents(a)[0][0] == "Report from b"
+
+
+def test_deletions_travel_as_tombstones(planners, tmp_path):
+    a, sync_a = planners("a")
+    b, sync_b = planners("b")
+    a.add_task("Write report", DEADLINE, "Work", "High")
+    a.add_task("Go running", DEADLINE, "Health", "Low")
+    sync(sync_a, sync_b, "a", "b", tmp_path / "1.json.gz")
+
+    b.delete_task(1)
+    assert sync(sync_b, sync_a, "b", "a", tmp_path / "2.json.gz")["deleted"] == 1
+    assert [task[1] for task in a.get_tasks()] == ["Go running"]
+
+    # Re-sending the older row version must not resurrect the deleted task
+    assert sync_b.apply_changes(str(tmp_path / "1.json.gz"), peer="a")["applied"] == 0
+    assert contents(a) == contents(b)